@@ -41,6 +41,37 @@ class ProjectComment(db.Model):
     email = db.Column(db.String(120), db.ForeignKey('user.email'), nullable=False)
     comment = db.Column(db.String(500), nullable=False)
 
+class Category(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), unique=True, nullable=False)
+
+class TaskCategory(db.Model):
+    # Índice compuesto (category_id, task_id): filtrar por categoría se resuelve
+    # solo con el índice y evita etiquetar dos veces la misma tarea
+    __table_args__ = (
+        db.Index('ix_task_category_category_task', 'category_id', 'task_id', unique=True),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    task_id = db.Column(db.Integer, db.ForeignKey('task.id'), nullable=False, index=True)
+    category_id = db.Column(db.Integer, db.ForeignKey('category.id'), nullable=False)
+
+def categories_by_task(task_ids):
+    # Cargar las categorías de varias tareas en una sola consulta IN
+    categories = {task_id: [] for task_id in task_ids}
+    if not task_ids:
+        return categories
+
+    rows = db.session.execute(
+        db.select(TaskCategory.task_id, Category.id, Category.name)
+        .join(Category, Category.id == TaskCategory.category_id)
+        .where(TaskCategory.task_id.in_(task_ids))
+        .order_by(Category.name)
+    )
+    for task_id, category_id, name in rows:
+        categories[task_id].append({'id': category_id, 'name': name})
+    return categories
+
 @app.route('/', methods=['GET'])
 def home():
     return render_template('index.html')
@@ -104,7 +135,17 @@ def tasks():
         return redirect(url_for('home'))
     
     email = session['email']
-    tasks = Task.query.filter_by(email=email).all()
+    selected = request.args.getlist('category', type=int)
+
+    query = Task.query.filter_by(email=email)
+    if selected:
+        # Semi-join sobre el índice (category_id, task_id): tareas con alguna de las categorías
+        query = query.filter(Task.id.in_(
+            db.select(TaskCategory.task_id).where(TaskCategory.category_id.in_(selected))
+        ))
+    tasks = query.all()
+
+    task_categories = categories_by_task([task.id for task in tasks])
 
     tasks_list = []
     for task in tasks:
@@ -113,10 +154,13 @@ def tasks():
             'email': task.email,
             'title': task.title,
             'description': task.description,
-            'date_task': task.date_task
+            'date_task': task.date_task,
+            'categories': task_categories[task.id]
         })
 
-    return render_template('tasks.html', tasks=tasks_list)
+    categories = Category.query.order_by(Category.name).all()
+
+    return render_template('tasks.html', tasks=tasks_list, categories=categories, selected=selected)
 
 @app.route('/new-task', methods=['POST'])
 def newTask():
@@ -143,10 +187,65 @@ def deleteTask():
     task_id = request.form['id']
     task = Task.query.filter_by(id=task_id).first()
     if task:
+        db.session.execute(db.delete(TaskCategory).where(TaskCategory.task_id == task.id))
         db.session.delete(task)
         db.session.commit()
     return redirect(url_for('tasks'))
 
+# Ruta para crear nueva categoría
+@app.route('/new-category', methods=['POST'])
+def newCategory():
+    if 'token' not in session:
+        return redirect(url_for('home'))
+
+    name = request.form['name'].strip()
+
+    if name and not Category.query.filter_by(name=name).first():
+        db.session.add(Category(name=name))
+        db.session.commit()
+    return redirect(url_for('tasks'))
+
+# Ruta para reasignar las categorías de una o varias tareas
+@app.route('/tag-tasks', methods=['POST'])
+def tagTasks():
+    if 'token' not in session:
+        return redirect(url_for('home'))
+
+    email = session['email']
+    requested_tasks = request.form.getlist('task_id', type=int)
+    requested_categories = request.form.getlist('category_id', type=int)
+
+    # Solo tareas del usuario y categorías existentes
+    task_ids = db.session.scalars(
+        db.select(Task.id).where(Task.email == email, Task.id.in_(requested_tasks))
+    ).all()
+    category_ids = db.session.scalars(
+        db.select(Category.id).where(Category.id.in_(requested_categories))
+    ).all()
+
+    if task_ids:
+        # Quitar las etiquetas que ya no aplican en una sola sentencia
+        db.session.execute(
+            db.delete(TaskCategory)
+            .where(TaskCategory.task_id.in_(task_ids))
+            .where(TaskCategory.category_id.not_in(category_ids))
+        )
+        # Insertar en bloque solo las parejas que faltan
+        existing = set(db.session.execute(
+            db.select(TaskCategory.task_id, TaskCategory.category_id)
+            .where(TaskCategory.task_id.in_(task_ids))
+        ).all())
+        missing = [
+            {'task_id': task_id, 'category_id': category_id}
+            for task_id in task_ids
+            for category_id in category_ids
+            if (task_id, category_id) not in existing
+        ]
+        if missing:
+            db.session.execute(db.insert(TaskCategory), missing)
+        db.session.commit()
+    return redirect(url_for('tasks'))
+
 # Nueva ruta para editar tarea
 @app.route('/edit-task/<task_id>', methods=['GET'])
 def editTask(task_id):
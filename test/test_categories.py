@@ -0,0 +1,117 @@
+import pytest
+from app import app, db, Task, Category, TaskCategory
+
+# Crear un cliente de prueba
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'  # Usar una base de datos en memoria
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    with app.test_client() as client:
+        with app.app_context():
+            from app import db  # Mover la importación aquí para evitar la duplicación de la instancia
+            db.create_all()  # Crear las tablas dentro del contexto de la aplicación
+        yield client
+        with app.app_context():
+            from app import db  # Asegurarse de que la importación de db sea dentro del contexto
+            db.drop_all()  # Eliminar las tablas después de cada prueba
+
+# Simular un usuario autenticado
+def login(client, email='test@example.com'):
+    with client.session_transaction() as sess:
+        sess['token'] = 'valid_token'
+        sess['email'] = email
+
+# Crear tareas y categorías de prueba y devolver sus IDs
+def create_data(email='test@example.com'):
+    with app.app_context():
+        tasks = [
+            Task(email=email, title='Task 1', description='Description 1', date_task='2024-12-01'),
+            Task(email=email, title='Task 2', description='Description 2', date_task='2024-12-02'),
+            Task(email=email, title='Task 3', description='Description 3', date_task='2024-12-03')
+        ]
+        categories = [Category(name='Work'), Category(name='Home')]
+        db.session.add_all(tasks + categories)
+        db.session.commit()
+        return [task.id for task in tasks], [category.id for category in categories]
+
+# Test de creación de categoría
+def test_new_category(client):
+    login(client)
+    response = client.post('/new-category', data={'name': 'Work'})
+    assert response.status_code == 302  # Redirección a /tasks
+
+    # Una categoría repetida no se duplica
+    client.post('/new-category', data={'name': 'Work'})
+
+    with app.app_context():
+        assert Category.query.filter_by(name='Work').count() == 1
+
+# Test de creación de categoría sin estar autenticado
+def test_new_category_without_token(client):
+    response = client.post('/new-category', data={'name': 'Work'})
+    assert response.headers['Location'] == '/'
+
+    with app.app_context():
+        assert Category.query.count() == 0
+
+# Test de etiquetado en bloque de varias tareas
+def test_tag_tasks(client):
+    task_ids, (work, home) = create_data()
+    login(client)
+
+    client.post('/tag-tasks', data={'task_id': task_ids[:2], 'category_id': [work, home]})
+
+    with app.app_context():
+        assert TaskCategory.query.count() == 4
+
+    # Reasignar: se quita "Home" y se conserva "Work" sin duplicarla
+    client.post('/tag-tasks', data={'task_id': task_ids[:2], 'category_id': [work]})
+
+    with app.app_context():
+        pairs = {(tc.task_id, tc.category_id) for tc in TaskCategory.query.all()}
+        assert pairs == {(task_ids[0], work), (task_ids[1], work)}
+
+# Test de que no se pueden etiquetar tareas de otro usuario
+def test_tag_tasks_other_user(client):
+    task_ids, (work, home) = create_data(email='other@example.com')
+    login(client)
+
+    client.post('/tag-tasks', data={'task_id': task_ids, 'category_id': [work]})
+
+    with app.app_context():
+        assert TaskCategory.query.count() == 0
+
+# Test de filtrado de /tasks por una o varias categorías
+def test_tasks_filter_by_category(client):
+    task_ids, (work, home) = create_data()
+    login(client)
+
+    client.post('/tag-tasks', data={'task_id': [task_ids[0]], 'category_id': [work]})
+    client.post('/tag-tasks', data={'task_id': [task_ids[1]], 'category_id': [work, home]})
+
+    response = client.get('/tasks?category=%d' % home)
+    assert response.status_code == 200
+    assert b'Task 1' not in response.data
+    assert b'Task 2' in response.data
+    assert b'Task 3' not in response.data
+
+    response = client.get('/tasks?category=%d&category=%d' % (work, home))
+    assert b'Task 1' in response.data
+    assert b'Task 2' in response.data
+    assert b'Task 3' not in response.data
+
+    # Sin filtro se muestran todas las tareas
+    response = client.get('/tasks')
+    assert b'Task 3' in response.data
+
+# Test de que al eliminar una tarea se eliminan sus etiquetas
+def test_delete_task_removes_categories(client):
+    task_ids, (work, home) = create_data()
+    login(client)
+
+    client.post('/tag-tasks', data={'task_id': [task_ids[0]], 'category_id': [work, home]})
+    client.post('/delete-task', data={'id': task_ids[0]})
+
+    with app.app_context():
+        assert TaskCategory.query.count() == 0